@@ -2,9 +2,9 @@
 
 from collections.abc import Callable
 from functools import partial, update_wrapper
-import inspect
 import threading
 import time
+from types import MethodType
 import weakref
 
 
@@ -29,7 +29,10 @@ class GeneratorWrapper(object):
 
     """Wraps a weak reference to a generator and adds convenience features."""
 
-    def __init__(self, weak_generator, catch_stopiteration=True, debug=False):
+    __slots__ = ('weak_generator', 'catch_stopiteration', 'debug', '_lock', '__weakref__')
+
+    def __init__(self, weak_generator, catch_stopiteration=True, debug=False, *,
+                 _lock=None):
         self.weak_generator = weak_generator
         self.catch_stopiteration = catch_stopiteration
         self.debug = debug
@@ -41,14 +44,21 @@ class GeneratorWrapper(object):
         # as long as the wrapper is used.
         # This is of course bypassed
         # by somone calling the generator's methods directly.
-        self._lock = threading.RLock()
+        # Wrappers derived from one another share the same lock
+        # since they guard the same generator.
+        if _lock is None:
+            _lock = threading.RLock()
+        self._lock = _lock
 
         if self.debug:
             print("new Wrapper created", self)
-
-    def __del__(self):
-        if self.debug:
-            print("Wrapper is being deleted", self)
+            # Instead of defining `__del__`,
+            # which would be called for every wrapper,
+            # only register a finalizer when it prints something.
+            # This means the deletion message depends on `debug`
+            # at creation time, not at deletion time.
+            finalizer = weakref.finalize(self, print, "Wrapper is being deleted", repr(self))
+            finalizer.atexit = False
 
     @property
     def _args(self):
@@ -62,12 +72,16 @@ class GeneratorWrapper(object):
 
     def with_strong_ref(self):
         """Get a StrongGeneratorWrapper with the same attributes."""
-        return StrongGeneratorWrapper(self.generator, *self._args)
+        return StrongGeneratorWrapper(self.generator, *self._args, _lock=self._lock)
 
     def with_weak_ref(self):
         """Get a (Weak)GeneratorWrapper with the same attributes."""
         return self
 
+    def _attach(self, generator, weak_generator):
+        """Fill in the generator of a wrapper created before it."""
+        self.weak_generator = weak_generator
+
     # Utility and shorthand functions/methods
     # for generating our "property" methods.
     def _wait(self, generator, method, timeout=None, *args, **kwargs):
@@ -78,7 +92,9 @@ class GeneratorWrapper(object):
         original_timeout = timeout
         while timeout is None or timeout > 0:
             last_time = time.time()
-            if self._lock.acquire(False):  # timeout param was added in 3.2
+            # Block on the lock rather than polling it,
+            # so that we wake up as soon as a running resume returns.
+            if self._lock.acquire(timeout=-1 if timeout is None else timeout):
                 try:
                     if self.can_resume():
                         return method(generator, *args, **kwargs)
@@ -95,11 +111,25 @@ class GeneratorWrapper(object):
             print(msg)
         raise WaitTimeoutError(msg)
 
+    def _bind(self, method):
+        """Bind the generator as the first argument of 'method'.
+
+        Keeps a strong reference to the generator
+        for as long as the returned callable is alive.
+        """
+        generator = self.generator
+        if generator is None:
+            # MethodType refuses to bind None,
+            # but the methods handle a collected generator themselves.
+            return partial(method, None)
+        # A bound MethodType is cheaper to create and call than a partial.
+        return MethodType(method, generator)
+
     # The "properties"
     @property
     def next(self):
         """Resume the generator."""
-        return partial(self._next, self.generator)
+        return self._bind(self._next)
 
     __next__ = next  # Python 3
 
@@ -111,7 +141,7 @@ class GeneratorWrapper(object):
     @property
     def next_wait(self):
         """Wait before nexting a value to the generator to resume it."""
-        return partial(self._next_wait, self.generator)
+        return self._bind(self._next_wait)
 
     def _next_wait(self, generator, timeout=None):
         return self._wait(generator, self._next, timeout)
@@ -119,7 +149,7 @@ class GeneratorWrapper(object):
     @property
     def next_wait_async(self):
         """Create a waiting daemon thread to resume the generator."""
-        return partial(self._next_wait_async, self.generator)
+        return self._bind(self._next_wait_async)
 
     def _next_wait_async(self, generator, timeout=None):
         thread = threading.Thread(
@@ -135,25 +165,26 @@ class GeneratorWrapper(object):
     @property
     def send(self):
         """Send a value to the generator to resume it."""
-        return partial(self._send, self.generator)
+        return self._bind(self._send)
 
     # A wrapper around send with a default value
     def _send(self, generator, value=None):
         if self.debug:
             print("send:", generator, value)
         with self._lock:
-            if self.catch_stopiteration:
-                try:
-                    return generator.send(value)
-                except StopIteration as si:
-                    return si.value
-            else:
+            # Only consult `catch_stopiteration` once the generator terminated
+            # so that resuming a generator does not need to branch.
+            try:
                 return generator.send(value)
+            except StopIteration as si:
+                if not self.catch_stopiteration:
+                    raise
+                return si.value
 
     @property
     def send_wait(self):
         """Wait before sending a value to the generator to resume it."""
-        return partial(self._send_wait, self.generator)
+        return self._bind(self._send_wait)
 
     def _send_wait(self, generator, value=None, timeout=None):
         return self._wait(generator, self._send, timeout, value)
@@ -161,7 +192,7 @@ class GeneratorWrapper(object):
     @property
     def send_wait_async(self):
         """Create a waiting daemon thread to send a value to the generator."""
-        return partial(self._send_wait_async, self.generator)
+        return self._bind(self._send_wait_async)
 
     def _send_wait_async(self, generator, value=None, timeout=None):
         thread = threading.Thread(
@@ -178,24 +209,32 @@ class GeneratorWrapper(object):
     @property
     def throw(self):
         """Raises an exception where the generator was suspended."""
-        return partial(self._throw, self.generator)
+        return self._bind(self._throw)
 
-    def _throw(self, generator, *args, **kwargs):
+    # Spelled out instead of forwarding `*args`
+    # to avoid packing them on every call.
+    # Only pass on what was given,
+    # since the 3-argument form of `generator.throw` is deprecated.
+    def _throw(self, generator, typ, val=None, tb=None):
         if self.debug:
-            print("throw:", generator, args, kwargs)
+            print("throw:", generator, typ, val, tb)
         with self._lock:
-            if self.catch_stopiteration:
-                try:
-                    return generator.throw(*args, **kwargs)
-                except StopIteration as si:
-                    return si.value
-            else:
-                return generator.throw(*args, **kwargs)
+            try:
+                if val is None and tb is None:
+                    return generator.throw(typ)
+                elif tb is None:
+                    return generator.throw(typ, val)
+                else:
+                    return generator.throw(typ, val, tb)
+            except StopIteration as si:
+                if not self.catch_stopiteration:
+                    raise
+                return si.value
 
     @property
     def throw_wait(self):
         """Wait before throwing a value to the generator to resume it."""
-        return partial(self._throw_wait, self.generator)
+        return self._bind(self._throw_wait)
 
     def _throw_wait(self, generator, *args, **kwargs):
         timeout = kwargs.pop('timeout', None)
@@ -204,7 +243,7 @@ class GeneratorWrapper(object):
     @property
     def throw_wait_async(self):
         """Create a waiting daemon thread to throw a value in the generator."""
-        return partial(self._throw_wait_async, self.generator)
+        return self._bind(self._throw_wait_async)
 
     def _throw_wait_async(self, *args, **kwargs):
         thread = threading.Thread(
@@ -220,8 +259,22 @@ class GeneratorWrapper(object):
 
     @property
     def close(self):
-        """Equivalent to ``self.generator.close``."""
-        return self.generator.close
+        """Close the generator after any running resume finished.
+
+        Like ``self.generator.close``,
+        but waits for the wrapper's lock
+        instead of raising ``ValueError``
+        when another thread is currently resuming the generator.
+        """
+        return self._bind(self._close)
+
+    # Hold the lock so that closing cannot interleave with a resume
+    # or a '*_wait' method that already decided to resume.
+    def _close(self, generator):
+        if self.debug:
+            print("close:", generator)
+        with self._lock:
+            return generator.close()
 
     def has_terminated(self):
         """Check if the wrapped generator has terminated."""
@@ -254,13 +307,19 @@ class StrongGeneratorWrapper(GeneratorWrapper):
 
     """Wraps a generator and adds convenience features."""
 
-    generator = None  # Override property of GeneratorWrapper
+    __slots__ = (
+        'generator',  # Overrides property of GeneratorWrapper
+        '_weak_twin',
+    )
 
     def __init__(self, generator, weak_generator=None, *args, **kwargs):
         """__init__
 
         :type generator: generator
-        :param generator: The generator object.
+        :param generator:
+            The generator object.
+            May be ``None`` if it is attached later
+            (only used internally by :class:`send_self`).
 
         :type weak_generator: weakref.ref
         :param weak_generator: Weak reference to a generator. Optional.
@@ -270,8 +329,9 @@ class StrongGeneratorWrapper(GeneratorWrapper):
         # It's important that the weak_generator object reference is preserved
         # because it will hold `finalize_callback` from @send_self.
         self.generator = generator
+        self._weak_twin = None
 
-        if weak_generator is None:
+        if weak_generator is None and generator is not None:
             weak_generator = weakref.ref(generator)
 
         super(StrongGeneratorWrapper, self).__init__(weak_generator, *args,
@@ -281,9 +341,31 @@ class StrongGeneratorWrapper(GeneratorWrapper):
         """Get a StrongGeneratorWrapper with the same attributes."""
         return self
 
+    def _attach(self, generator, weak_generator):
+        self.generator = generator
+        super(StrongGeneratorWrapper, self)._attach(generator, weak_generator)
+
     def with_weak_ref(self):
         """Get a (Weak)GeneratorWrapper with the same attributes."""
-        return GeneratorWrapper(*self._args)
+        # The weak wrapper doesn't keep us alive,
+        # so we can hold on to it and save allocations
+        # when switching back and forth.
+        # It is only recreated if either's attributes have been modified.
+        twin = self._weak_twin
+        if twin is None or twin._args != self._args:
+            twin = self._weak_twin = GeneratorWrapper(*self._args, _lock=self._lock)
+        return twin
+
+    # We already hold a strong reference to the generator,
+    # so plain (bound) methods keep it alive just as well
+    # and save us from binding the generator on every access.
+    def send(self, value=None):
+        """Send a value to the generator to resume it."""
+        return self._send(self.generator, value)
+
+    def throw(self, typ, val=None, tb=None):
+        """Raises an exception where the generator was suspended."""
+        return self._throw(self.generator, typ, val, tb)
 
     def __eq__(self, other):
         if type(other) is StrongGeneratorWrapper:
@@ -301,12 +383,13 @@ class send_self:  # noqa: N801
     Can be called with parameters or used as a decorator directly.
     """
 
-    # __slots__ = ['func', 'catch_stopiteration', 'finalize_callback', 'debug']
+    # __slots__ = ['func', 'catch_stopiteration', 'finalize_callback', 'debug', 'strong']
 
     def __init__(self, func=None, *,
                  catch_stopiteration=True,
                  finalize_callback=None,
-                 debug=False):
+                 debug=False,
+                 strong=False):
         # Typechecking
         if func is not None:
             self._validate_func(func)
@@ -314,6 +397,7 @@ class send_self:  # noqa: N801
         type_table = [
             ('catch_stopiteration', bool),
             ('debug', bool),
+            ('strong', bool),
             ('finalize_callback', (Callable, type(None)))
         ]
         for name, type_ in type_table:
@@ -326,6 +410,7 @@ class send_self:  # noqa: N801
         self.catch_stopiteration = catch_stopiteration
         self.finalize_callback = finalize_callback
         self.debug = debug
+        self.strong = strong
 
         # Wrap func if it was specified
         if func:
@@ -338,7 +423,11 @@ class send_self:  # noqa: N801
             raise ValueError("Cannot wrap classmethod - try reversing wrap order")
         elif not callable(func):
             raise TypeError("Decorator must wrap a callable")
-        elif not inspect.isgeneratorfunction(func):
+
+        # `inspect` takes a while to import,
+        # so only do so once something is decorated.
+        import inspect
+        if not inspect.isgeneratorfunction(func):
             raise ValueError("Callable must be a generator function")
 
     def __call__(self, *args, **kwargs):
@@ -351,31 +440,57 @@ class send_self:  # noqa: N801
             update_wrapper(self, self.func)
             return self
 
-        # Create generator wrapper to pass a wrapper to the running instance
-        # as the first argument
-        def wrapper():
-            return (yield from self.func(gen_wrapper, *args, **kwargs))
-        generator = wrapper()
+        # Create the wrapper before the generator
+        # so that we can pass it to the generator function
+        # as the first argument directly,
+        # without delegating every resume through an intermediate generator.
+        # The generator is attached once it exists.
+        # Attributes used more than once are only looked up once.
+        strong = self.strong
+        catch_stopiteration, debug = self.catch_stopiteration, self.debug
+        if strong:
+            gen_wrapper = StrongGeneratorWrapper(None, None, catch_stopiteration, debug)
+        else:
+            gen_wrapper = GeneratorWrapper(None, catch_stopiteration, debug)
+        generator = self.func(gen_wrapper, *args, **kwargs)
 
         # Register finalize_callback to be called when the object is gc'ed
-        weak_generator = weakref.ref(generator, self.finalize_callback)
-
-        strong_gen_wrapper = StrongGeneratorWrapper(
-            generator,
-            weak_generator,
-            self.catch_stopiteration,
-            self.debug
-        )
-        gen_wrapper = strong_gen_wrapper.with_weak_ref()
-        gen_wrapper.next()  # Start the first iteration
+        finalize_callback = self.finalize_callback
+        if strong and finalize_callback is not None:
+            # Our wrapper and thus its weak reference
+            # are part of a cycle with a suspended generator.
+            # The cyclic gc does not run callbacks of weak references
+            # that are garbage themselves,
+            # so keep the callback reachable through a finalizer instead.
+            weak_generator = weakref.ref(generator)
+            finalizer = weakref.finalize(generator, finalize_callback, weak_generator)
+            finalizer.atexit = False
+        else:
+            weak_generator = weakref.ref(generator, finalize_callback)
+        gen_wrapper._attach(generator, weak_generator)
+        if strong:
+            strong_gen_wrapper = gen_wrapper
+        else:
+            strong_gen_wrapper = gen_wrapper.with_strong_ref()
+        gen_wrapper._next(generator)  # Start the first iteration
         return strong_gen_wrapper
 
     def __get__(self, obj, typeobj=None):
         # Proxy descriptor access for {static,class,}methods
         new_func = self.func.__get__(obj, typeobj)
-        return self.__class__(
-            func=new_func,
-            catch_stopiteration=self.catch_stopiteration,
-            finalize_callback=self.finalize_callback,
-            debug=self.debug,
-        )
+
+        # This runs on every method access,
+        # so skip the checks in __init__
+        # since our parameters have already been validated.
+        # The metadata copied by `update_wrapper` is the same
+        # for the bound method as for the function,
+        # so we can take it from our own attributes,
+        # unless `func` has been reassigned since.
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.func = new_func
+        if getattr(self, '__wrapped__', None) is self.func:
+            new.__wrapped__ = new_func
+        else:
+            update_wrapper(new, new_func)
+        return new
@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+import sys
 import threading
 import time
 
 
 DEFAULT_SLEEP = 0.01
 
+# Re-use threads for deferred calls instead of starting a new one each time
+_executor = ThreadPoolExecutor(max_workers=8)
+
 
 class CustomError(Exception):
     pass
@@ -19,8 +24,21 @@ def defer(callback, *args,
         else:
             print("generator is not re-called")
 
-    t = threading.Thread(target=func)
-    t.start()
+    _executor.submit(func).add_done_callback(_report_exception)
+
+
+def _report_exception(future):
+    # Report failures like an exception in a plain thread would be,
+    # instead of silently storing them on the future.
+    exc = future.exception()
+    if exc is None:
+        return
+    if hasattr(threading, 'excepthook'):  # Python 3.8+
+        threading.excepthook(threading.ExceptHookArgs(
+            (type(exc), exc, exc.__traceback__, threading.current_thread())
+        ))
+    else:
+        sys.excepthook(type(exc), exc, exc.__traceback__)
 
 
 def wait_until_finished(wrapper, timeout=1, sleep=DEFAULT_SLEEP):
@@ -1,8 +1,14 @@
 import time
+import warnings
 
 import pytest
 
-from resumeback import send_self, WaitTimeoutError
+from resumeback import (
+    send_self,
+    GeneratorWrapper,
+    StrongGeneratorWrapper,
+    WaitTimeoutError,
+)
 
 from . import CustomError, defer, wait_until_finished, State
 
@@ -81,6 +87,48 @@ def test_throw_return():
     assert val == wrapper.throw(CustomError)
 
 
+@pytest.mark.parametrize('strong', [False, True])
+def test_throw_forms(strong):
+    val = 987
+    received = []
+
+    def make_error():
+        try:
+            raise CustomError(val)
+        except CustomError as e:
+            return e, e.__traceback__
+
+    @send_self
+    def func(_):
+        while True:
+            try:
+                yield
+            except CustomError as e:
+                received.append(e)
+
+    wrapper = func()
+    this = wrapper if strong else wrapper.with_weak_ref()
+    assert type(this) is (StrongGeneratorWrapper if strong else GeneratorWrapper)
+
+    this.throw(CustomError)
+    assert received.pop().args == ()
+
+    this.throw(CustomError, val)
+    assert received.pop().args == (val,)
+
+    error, tb = make_error()
+    with warnings.catch_warnings():
+        # The 3-argument signature is deprecated since Python 3.12
+        warnings.simplefilter('ignore', DeprecationWarning)
+        this.throw(CustomError, error, tb)
+    e = received.pop()
+    assert e is error
+    traceback = e.__traceback__
+    while traceback is not None and traceback is not tb:
+        traceback = traceback.tb_next
+    assert traceback is tb
+
+
 def test_close():
     ts = State()
 
@@ -95,6 +143,27 @@ def test_close():
     assert ts.run
 
 
+def test_close_waits():
+    ts = State()
+
+    @send_self
+    def func(this):
+        # Close from another thread while we are still running
+        defer(this.close, sleep=0)
+        time.sleep(0.05)
+        ts.run = True
+        try:
+            yield
+        except GeneratorExit:
+            ts.inc()
+            raise
+
+    wrapper = func()
+    wait_until_finished(wrapper)
+    assert ts.run
+    assert ts.counter == 1
+
+
 def test_close_generatorexit():
     ts = State()
 
@@ -102,7 +171,9 @@ def test_close_generatorexit():
         with pytest.raises(RuntimeError):
             this.close()
         ts.inc()
-        this.next()  # TOCHECK should this run or should the gen close?
+        # Like a plain generator,
+        # it is still suspended after ignoring GeneratorExit.
+        this.next()
 
     @send_self
     def func(this):
@@ -115,7 +186,7 @@ def test_close_generatorexit():
 
     wrapper = func().with_weak_ref()
     wait_until_finished(wrapper)
-    assert ts.counter == 3
+    assert ts.counter == 4
 
 
 def test_close_garbagecollected():
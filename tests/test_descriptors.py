@@ -18,6 +18,31 @@ def test_method():
     assert a.param == 123
 
 
+def test_method_wrapping():
+    class A:
+        @send_self
+        def method(self, this):
+            """generic docstring"""
+            yield  # pragma: no cover
+
+    a = A()
+    for attr in ('__doc__', '__name__', '__qualname__', '__module__'):
+        assert getattr(a.method, attr) == getattr(A.method.func, attr)
+    assert a.method.__wrapped__ == a.method.func
+    assert a.method.func.__self__ is a
+
+    # Reassigned functions are reflected in bound copies
+    def other(self, this):
+        """other docstring"""
+        yield  # pragma: no cover
+
+    A.__dict__['method'].func = other
+    assert a.method.__name__ == 'other'
+    assert a.method.__doc__ == "other docstring"
+    assert a.method.__wrapped__ == a.method.func
+    assert a.method.func.__func__ is other
+
+
 def test_classmethod():
     ts = State()
 
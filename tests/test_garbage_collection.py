@@ -5,7 +5,7 @@ import pytest
 
 from resumeback import send_self
 
-from . import defer, wait_until_finished, State
+from . import CustomError, defer, wait_until_finished, State
 
 
 def test_normal_termination():
@@ -65,6 +65,29 @@ def test_weakref_suspended_deferred():
     assert wrapper.generator is None
 
 
+def test_wait_collected():
+    @send_self
+    def func(_):
+        yield
+
+    wrapper = func().with_weak_ref()
+    gc.collect()
+    assert wrapper.generator is None
+
+    with pytest.raises(RuntimeError):
+        wrapper.next_wait(timeout=0.1)
+    with pytest.raises(RuntimeError):
+        wrapper.send_wait(1, timeout=0.1)
+    with pytest.raises(RuntimeError):
+        wrapper.throw_wait(CustomError, timeout=0.1)
+
+    for thread in (wrapper.next_wait_async(timeout=0.1),
+                   wrapper.send_wait_async(1, timeout=0.1),
+                   wrapper.throw_wait_async(CustomError, timeout=0.1)):
+        thread.join(1)
+        assert not thread.is_alive()
+
+
 def test_strongref_suspended():
     ts = State()
 
@@ -105,6 +128,28 @@ def test_strongref_suspended_deferred():
     assert wrapper.generator is not None
 
 
+@pytest.mark.parametrize('terminate', [False, True])
+def test_strong_finalize_callback(terminate):
+    ts = State()
+
+    def cb(ref):
+        assert ref() is None
+        ts.inc()
+
+    # Don't keep a reference to the weak reference around here,
+    # since that would keep its callback alive
+    @send_self(strong=True, finalize_callback=cb)
+    def func(_):
+        yield
+
+    wrapper = func()
+    if terminate:
+        wrapper.next()
+    del wrapper
+    gc.collect()
+    assert ts.counter == 1
+
+
 @pytest.mark.xfail(sys.version_info < (3, 4) or sys.version_info >= (3, 7),
                    raises=AssertionError,
                    reason="changes in garbage collection")
@@ -23,6 +23,24 @@ def test_wrapper_type():
     assert ts.run
 
 
+def test_strong_wrapper_type():
+    ts = State()
+
+    @send_self(strong=True)
+    def func(this):
+        assert type(this) is StrongGeneratorWrapper
+        assert this.with_strong_ref() is this
+        assert type(this()) is GeneratorWrapper
+        ts.this = this
+        yield
+
+    wrapper = func()
+    assert wrapper is ts.this
+    assert wrapper.generator is wrapper.weak_generator()
+    wrapper.next()
+    assert wrapper.has_terminated()
+
+
 def test_send_self_return():
     ts = State()
     val = 123 + random()
@@ -171,6 +189,7 @@ def test_parameter():
         (TypeError, None, [], {'finalize_callback': 1}),
         (TypeError, None, [], {'finalize_callback': False}),
         (TypeError, None, [], {'debug': 1}),
+        (TypeError, None, [], {'strong': 1}),
         # "delayed" func
         (TypeError, type, [], {'catch_stopiteration': 1}),
         (ValueError, type, [], {'catch_stopiteration': True}),
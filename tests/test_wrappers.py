@@ -59,6 +59,7 @@ def test_with_weak_ref():
             assert that == this
 
             assert that.weak_generator is this.weak_generator
+            assert that._lock is this._lock
             assert comp_ref.weak_generator is not that.weak_generator
             assert comp_ref.weak_generator == that.weak_generator
         ts.run = True
@@ -89,6 +90,7 @@ def test_with_strong_ref():
             assert that == this_strong
 
             assert that.weak_generator is this.weak_generator
+            assert that._lock is this._lock
             assert comp_ref.weak_generator is not that.weak_generator
             assert comp_ref.weak_generator == that.weak_generator
         del thises
@@ -101,6 +103,26 @@ def test_with_strong_ref():
     assert ts.run
 
 
+def test_with_weak_ref_reused():
+    ts = State()
+
+    @send_self
+    def func(this):
+        ts.this = this
+        yield
+
+    wrapper = func()
+    weak_wrapper = wrapper.with_weak_ref()
+    assert weak_wrapper is not ts.this
+    assert weak_wrapper is wrapper.with_weak_ref()
+
+    # Modified attributes are not shared with the old wrapper
+    wrapper.debug = True
+    assert wrapper.with_weak_ref() is not weak_wrapper
+    assert wrapper.with_weak_ref().debug is True
+    assert ts.this.debug is False
+
+
 def test_has_terminated_simple():
     ts = State()
 